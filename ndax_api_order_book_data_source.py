@@ -1,6 +1,7 @@
 import aiohttp
 import asyncio
 import logging
+import orjson
 import time
 
 from typing import (
@@ -19,15 +20,23 @@ from hummingbot.core.data_type.order_book import OrderBook
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger.logger import HummingbotLogger
 
 
 class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     _ORDER_BOOK_SNAPSHOT_DELAY = 60 * 60  # expressed in seconds
+    _TRADING_PAIR_ID_MAP_TTL = 60 * 60  # expressed in seconds
+    _TRADING_PAIR_ID_MAP_RETRY_INTERVAL = 60  # expressed in seconds
+    _WS_COMPRESSION_WINDOW_BITS = 15
 
     _logger: Optional[HummingbotLogger] = None
     _trading_pair_id_map: Dict[str, int] = {}
+    _instrument_id_trading_pair_map: Dict[int, str] = {}
+    _trading_pair_id_map_timestamp: float = 0
+    _trading_pair_id_map_lock: Optional[asyncio.Lock] = None
     _last_traded_prices: Dict[str, float] = {}
+    _shared_session: Optional[aiohttp.ClientSession] = None
 
     def __init__(
         self,
@@ -37,7 +46,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         domain: Optional[str] = None,
     ):
         super().__init__(trading_pairs)
-        self._shared_client = shared_client or self._get_session_instance()
+        self._shared_client = shared_client
         self._throttler = throttler or self._get_throttler_instance()
         self._domain: Optional[str] = domain
 
@@ -49,8 +58,31 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     def _get_session_instance(cls) -> aiohttp.ClientSession:
-        session = aiohttp.ClientSession()
-        return session
+        """
+        Returns the session shared by all requests performed without an explicit client, so that connections, DNS
+        resolutions and TLS sessions are reused across calls
+        """
+        if cls._shared_session is None or cls._shared_session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=30, ttl_dns_cache=300, enable_cleanup_closed=True)
+            cls._shared_session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+        return cls._shared_session
+
+    @classmethod
+    async def close_session_instance(cls):
+        """
+        Closes the shared session. It is called when the order book tracker stops. A new one is created the next time
+        a request needs it
+        """
+        if cls._shared_session is not None:
+            await cls._shared_session.close()
+            cls._shared_session = None
+
+    def _get_client(self) -> aiohttp.ClientSession:
+        """
+        Returns the client provided at construction, or the class-level shared session if none was given. The shared
+        session is resolved on every call so that a closed one is replaced instead of being kept by the instance
+        """
+        return self._shared_client or self._get_session_instance()
 
     @classmethod
     def _get_throttler_instance(cls) -> AsyncThrottler:
@@ -59,32 +91,84 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def init_trading_pair_ids(cls, domain: Optional[str] = None, throttler: Optional[AsyncThrottler] = None, shared_client: Optional[aiohttp.ClientSession] = None):
-        """Initialize _trading_pair_id_map class variable
+        """Initialize _trading_pair_id_map class variable. The map is only fetched again once it is older than
+        _TRADING_PAIR_ID_MAP_TTL
         """
-        cls._trading_pair_id_map.clear()
+        if cls._is_trading_pair_id_map_fresh():
+            return
 
-        shared_client = shared_client or cls._get_session_instance()
+        if cls._trading_pair_id_map_lock is None:
+            cls._trading_pair_id_map_lock = asyncio.Lock()
 
-        params = {
-            "OMSId": 1
-        }
+        async with cls._trading_pair_id_map_lock:
+            # Concurrent callers wait for the request in flight instead of issuing their own
+            if cls._is_trading_pair_id_map_fresh():
+                return
 
-        throttler = throttler or cls._get_throttler_instance()
-        async with throttler.execute_task(CONSTANTS.MARKETS_URL):
-            async with shared_client.get(
-                f"{ndax_utils.rest_api_url(domain) + CONSTANTS.MARKETS_URL}", params=params
-            ) as response:
-                if response.status == 200:
-                    resp_json: Dict[str, Any] = await response.json()
+            shared_client = shared_client or cls._get_session_instance()
 
-                    results = {
-                        f"{instrument['Product1Symbol']}-{instrument['Product2Symbol']}": int(
-                            instrument["InstrumentId"])
-                        for instrument in resp_json
-                        if instrument["SessionStatus"] == "Running"
-                    }
+            params = {
+                "OMSId": 1
+            }
+
+            throttler = throttler or cls._get_throttler_instance()
+            try:
+                async with throttler.execute_task(CONSTANTS.MARKETS_URL):
+                    async with shared_client.get(
+                        f"{ndax_utils.rest_api_url(domain) + CONSTANTS.MARKETS_URL}", params=params
+                    ) as response:
+                        if response.status == 200:
+                            resp_json: Dict[str, Any] = orjson.loads(await response.read())
+
+                            results = {
+                                f"{instrument['Product1Symbol']}-{instrument['Product2Symbol']}": int(
+                                    instrument["InstrumentId"])
+                                for instrument in resp_json
+                                if instrument["SessionStatus"] == "Running"
+                            }
+
+                            # Pairs paused since the last fetch are kept, so tracked orders and books still resolve
+                            cls._trading_pair_id_map = {**cls._trading_pair_id_map, **results}
+                            cls._instrument_id_trading_pair_map = {
+                                **cls._instrument_id_trading_pair_map,
+                                **{instrument_id: trading_pair for trading_pair, instrument_id in results.items()}
+                            }
+                            cls._trading_pair_id_map_timestamp = time.time()
+                        elif len(cls._trading_pair_id_map) > 0:
+                            cls.logger().warning(f"Error refreshing the instrument ids (HTTP status {response.status})."
+                                                 f" Using the previously fetched ones.")
+                            cls._postpone_trading_pair_id_map_refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A stale map is still valid for placing and tracking orders, so only fail if there is none
+                if len(cls._trading_pair_id_map) == 0:
+                    raise
+                cls.logger().warning("Error refreshing the instrument ids. Using the previously fetched ones.",
+                                     exc_info=True)
+                cls._postpone_trading_pair_id_map_refresh()
 
-                    cls._trading_pair_id_map = results
+    @classmethod
+    def _postpone_trading_pair_id_map_refresh(cls):
+        """Marks the current map as fresh for another _TRADING_PAIR_ID_MAP_RETRY_INTERVAL seconds, so that callers keep
+        using it instead of each retrying the failed request
+        """
+        cls._trading_pair_id_map_timestamp = (
+            time.time() - cls._TRADING_PAIR_ID_MAP_TTL + cls._TRADING_PAIR_ID_MAP_RETRY_INTERVAL
+        )
+
+    @classmethod
+    def trading_pair_from_instrument_id(cls, instrument_id: int) -> Optional[str]:
+        """Translates an NDAX instrument id into the Hummingbot trading pair it represents
+
+        :return: str: The trading pair, or None if the instrument id is unknown
+        """
+        return cls._instrument_id_trading_pair_map.get(instrument_id)
+
+    @classmethod
+    def _is_trading_pair_id_map_fresh(cls) -> bool:
+        return (len(cls._trading_pair_id_map) > 0
+                and time.time() - cls._trading_pair_id_map_timestamp < cls._TRADING_PAIR_ID_MAP_TTL)
 
     @classmethod
     async def get_last_traded_prices(
@@ -95,35 +179,47 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :params: List[str] trading_pairs: List of trading pairs(in Hummingbot base-quote format i.e. BTC-CAD)
         :return: Dict[str, float]: Dictionary of the trading pairs mapped to its last traded price in float
         """
-        if not len(cls._trading_pair_id_map) > 0:
-            await cls.init_trading_pair_ids(domain)
+        await cls.init_trading_pair_ids(domain, throttler, shared_client)
 
         shared_client = shared_client or cls._get_session_instance()
+        throttler = throttler or cls._get_throttler_instance()
 
-        results = {}
-
-        for trading_pair in trading_pairs:
-            if trading_pair in cls._last_traded_prices:
-                results[trading_pair] = cls._last_traded_prices[trading_pair]
-            else:
-                params = {
-                    "OMSId": 1,
-                    "InstrumentId": cls._trading_pair_id_map[trading_pair],
-                }
-                throttler = throttler or cls._get_throttler_instance()
-                async with throttler.execute_task(CONSTANTS.LAST_TRADE_PRICE_URL):
-                    async with shared_client.get(
-                        f"{ndax_utils.rest_api_url(domain) + CONSTANTS.LAST_TRADE_PRICE_URL}", params=params
-                    ) as response:
-                        if response.status == 200:
-                            resp_json: Dict[str, Any] = await response.json()
+        results = {trading_pair: cls._last_traded_prices[trading_pair]
+                   for trading_pair in trading_pairs
+                   if trading_pair in cls._last_traded_prices}
 
-                            results.update({
-                                trading_pair: float(resp_json["LastTradedPx"])
-                            })
+        pending_trading_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in results]
+        prices: List[Optional[float]] = await safe_gather(*[
+            cls._get_last_traded_price(trading_pair, domain, throttler, shared_client)
+            for trading_pair in pending_trading_pairs
+        ])
+        results.update({trading_pair: price
+                        for trading_pair, price in zip(pending_trading_pairs, prices)
+                        if price is not None})
 
         return results
 
+    @classmethod
+    async def _get_last_traded_price(
+        cls, trading_pair: str, domain: Optional[str], throttler: AsyncThrottler, shared_client: aiohttp.ClientSession
+    ) -> Optional[float]:
+        """Fetches the Last Traded Price of a single trading pair.
+
+        :return: float: The last traded price, or None if the request was not successful
+        """
+        params = {
+            "OMSId": 1,
+            "InstrumentId": cls._trading_pair_id_map[trading_pair],
+        }
+        async with throttler.execute_task(CONSTANTS.LAST_TRADE_PRICE_URL):
+            async with shared_client.get(
+                f"{ndax_utils.rest_api_url(domain) + CONSTANTS.LAST_TRADE_PRICE_URL}", params=params
+            ) as response:
+                if response.status == 200:
+                    resp_json: Dict[str, Any] = orjson.loads(await response.read())
+                    return float(resp_json["LastTradedPx"])
+        return None
+
     @staticmethod
     async def fetch_trading_pairs(domain: str = None, throttler: Optional[AsyncThrottler] = None) -> List[str]:
         """Fetches and formats all supported trading pairs.
@@ -131,17 +227,18 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Returns:
             List[str]: List of supported trading pairs in Hummingbot's format. (i.e. BASE-QUOTE)
         """
+        params = {
+            "OMSId": 1
+        }
+        throttler = throttler or NdaxAPIOrderBookDataSource._get_throttler_instance()
+        # This is a one-off call made before any tracker exists, so it uses its own session instead of the shared one
         async with aiohttp.ClientSession() as client:
-            params = {
-                "OMSId": 1
-            }
-            throttler = throttler or NdaxAPIOrderBookDataSource._get_throttler_instance()
             async with throttler.execute_task(CONSTANTS.MARKETS_URL):
                 async with client.get(
                     f"{ndax_utils.rest_api_url(domain) + CONSTANTS.MARKETS_URL}", params=params
                 ) as response:
                     if response.status == 200:
-                        resp_json: Dict[str, Any] = await response.json()
+                        resp_json: Dict[str, Any] = orjson.loads(await response.read())
                         return [f"{instrument['Product1Symbol']}-{instrument['Product2Symbol']}"
                                 for instrument in resp_json
                                 if instrument["SessionStatus"] == "Running"]
@@ -160,28 +257,27 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Returns:
             Dict[str, any]: Parsed API Response.
         """
-        if not len(self._trading_pair_id_map) > 0:
-            await self.init_trading_pair_ids(domain)
+        await self.init_trading_pair_ids(domain, throttler or self._throttler, self._shared_client)
         params = {
             "OMSId": 1,
             "InstrumentId": self._trading_pair_id_map[trading_pair],
-            "Depth": 200,
+            "Depth": CONSTANTS.ORDER_BOOK_DEPTH,
         }
 
         throttler = throttler or self._get_throttler_instance()
         async with throttler.execute_task(CONSTANTS.ORDER_BOOK_URL):
-            async with self._shared_client.get(
+            async with self._get_client().get(
                 f"{ndax_utils.rest_api_url(domain) + CONSTANTS.ORDER_BOOK_URL}", params=params
             ) as response:
                 status = response.status
                 if status != 200:
                     raise IOError(
                         f"Error fetching OrderBook for {trading_pair} at {CONSTANTS.ORDER_BOOK_URL}. "
-                        f"HTTP {status}. Response: {await response.json()}"
+                        f"HTTP {status}. Response: {await response.text()}"
                     )
 
-                response_ls: List[Any] = await response.json()
-                orderbook_entries: List[NdaxOrderBookEntry] = [NdaxOrderBookEntry(*entry) for entry in response_ls]
+                response_ls: List[Any] = orjson.loads(await response.read())
+                orderbook_entries: List[NdaxOrderBookEntry] = list(map(NdaxOrderBookEntry._make, response_ls))
                 return {"data": orderbook_entries,
                         "timestamp": int(time.time() * 1e3)}
 
@@ -192,12 +288,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         await asyncio.sleep(delay)
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        snapshot: Dict[str, Any] = await self.get_order_book_data(trading_pair, self._domain)
-
-        snapshot_msg: NdaxOrderBookMessage = NdaxOrderBook.snapshot_message_from_exchange(
-            msg=snapshot,
-            timestamp=snapshot["timestamp"],
-        )
+        snapshot_msg: NdaxOrderBookMessage = await self._get_snapshot_message(trading_pair)
         order_book = self.order_book_create_function()
 
         bids, asks = snapshot_msg.bids, snapshot_msg.asks
@@ -206,8 +297,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return order_book
 
     async def get_instrument_ids(self) -> Dict[str, int]:
-        if not len(self._trading_pair_id_map) > 0:
-            await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
+        await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
         return self._trading_pair_id_map
 
     async def _create_websocket_connection(self) -> NdaxWebSocketAdaptor:
@@ -215,7 +305,10 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Initialize WebSocket client for UserStreamDataSource
         """
         try:
-            ws = await self._shared_client.ws_connect(ndax_utils.wss_url(self._domain))
+            # Level2 frames repeat the same structure over and over, so they compress well with permessage-deflate.
+            # aiohttp falls back to uncompressed frames if the server does not accept the extension
+            ws = await self._get_client().ws_connect(ndax_utils.wss_url(self._domain),
+                                                    compress=self._WS_COMPRESSION_WINDOW_BITS)
             return NdaxWebSocketAdaptor(throttler=self._throttler, websocket=ws)
         except asyncio.CancelledError:
             raise
@@ -224,27 +317,52 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                   f"({ex})")
             raise
 
+    async def _get_snapshot_message(self, trading_pair: str) -> NdaxOrderBookMessage:
+        """
+        Fetches the orderbook snapshot of a single trading pair and converts it into a snapshot message
+        """
+        snapshot: Dict[str: Any] = await self.get_order_book_data(trading_pair, domain=self._domain)
+        metadata = {
+            "trading_pair": trading_pair,
+            "instrument_id": self._trading_pair_id_map.get(trading_pair, None)
+        }
+        return NdaxOrderBook.snapshot_message_from_exchange(
+            msg=snapshot,
+            timestamp=snapshot["timestamp"],
+            metadata=metadata
+        )
+
+    async def _fetch_snapshot_message(self, trading_pair: str) -> Optional[NdaxOrderBookMessage]:
+        """
+        Fetches the orderbook snapshot of a single trading pair. Errors are logged and result in None, so that a
+        failing trading pair does not prevent the snapshots of the other ones from being processed.
+        """
+        try:
+            return await self._get_snapshot_message(trading_pair)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Unexpected error fetching orderbook snapshot for {trading_pair}.",
+                                  exc_info=True,
+                                  app_warning_msg=f"Could not fetch {trading_pair} orderbook snapshot from NDAX. "
+                                                  f"Check network connection.")
+            return None
+
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         Periodically polls for orderbook snapshots using the REST API.
         """
-        if not len(self._trading_pair_id_map) > 0:
-            await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
+        await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
+        next_snapshot_time = time.monotonic() + self._ORDER_BOOK_SNAPSHOT_DELAY
         while True:
-            await self._sleep(self._ORDER_BOOK_SNAPSHOT_DELAY)
+            await self._sleep(max(0.0, next_snapshot_time - time.monotonic()))
             try:
-                for trading_pair in self._trading_pairs:
-                    snapshot: Dict[str: Any] = await self.get_order_book_data(trading_pair, domain=self._domain)
-                    metadata = {
-                        "trading_pair": trading_pair,
-                        "instrument_id": self._trading_pair_id_map.get(trading_pair, None)
-                    }
-                    snapshot_message: NdaxOrderBookMessage = NdaxOrderBook.snapshot_message_from_exchange(
-                        msg=snapshot,
-                        timestamp=snapshot["timestamp"],
-                        metadata=metadata
-                    )
-                    output.put_nowait(snapshot_message)
+                snapshot_messages: List[Optional[NdaxOrderBookMessage]] = await safe_gather(
+                    *[self._fetch_snapshot_message(trading_pair) for trading_pair in self._trading_pairs]
+                )
+                for snapshot_message in snapshot_messages:
+                    if snapshot_message is not None:
+                        output.put_nowait(snapshot_message)
 
             except asyncio.CancelledError:
                 raise
@@ -253,62 +371,72 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                                     exc_info=True)
                 await self._sleep(5.0)
 
+            # Keep the original cadence, skipping the slots that were missed while this iteration was running
+            missed_snapshots = int((time.monotonic() - next_snapshot_time) // self._ORDER_BOOK_SNAPSHOT_DELAY)
+            next_snapshot_time += (max(missed_snapshots, 0) + 1) * self._ORDER_BOOK_SNAPSHOT_DELAY
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
         Listen for orderbook diffs using WebSocket API.
         """
-        if not len(self._trading_pair_id_map) > 0:
-            await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
+        await self.init_trading_pair_ids(self._domain, self._throttler, self._shared_client)
+
+        snapshot_event: str = CONSTANTS.WS_ORDER_BOOK_CHANNEL
+        update_event: str = CONSTANTS.WS_ORDER_BOOK_L2_UPDATE_EVENT
+        order_book_events = {snapshot_event, update_event}
+        # Event names only appear with unescaped quotes in the "n" field of a frame, since the "o" payload is itself an
+        # escaped JSON string. Frames that contain neither token are not order book events and are skipped undecoded
+        snapshot_event_token = f'"{snapshot_event}"'
+        update_event_token = f'"{update_event}"'
 
         while True:
+            ws_adaptor: Optional[NdaxWebSocketAdaptor] = None
             try:
-                ws_adaptor: NdaxWebSocketAdaptor = await self._create_websocket_connection()
+                ws_adaptor = await self._create_websocket_connection()
                 for trading_pair in self._trading_pairs:
                     payload = {
                         "OMSId": 1,
                         "Symbol": convert_to_exchange_trading_pair(trading_pair),
-                        "Depth": 200
+                        "Depth": CONSTANTS.ORDER_BOOK_DEPTH
                     }
                     async with self._throttler.execute_task(CONSTANTS.WS_ORDER_BOOK_CHANNEL):
                         await ws_adaptor.send_request(endpoint_name=CONSTANTS.WS_ORDER_BOOK_CHANNEL,
                                                       payload=payload)
                 async for raw_msg in ws_adaptor.iter_messages():
-                    payload = NdaxWebSocketAdaptor.payload_from_raw_message(raw_msg)
-                    msg_event: str = NdaxWebSocketAdaptor.endpoint_from_raw_message(raw_msg)
-                    if msg_event in [CONSTANTS.WS_ORDER_BOOK_CHANNEL, CONSTANTS.WS_ORDER_BOOK_L2_UPDATE_EVENT]:
-                        msg_data: List[NdaxOrderBookEntry] = [NdaxOrderBookEntry(*entry)
-                                                              for entry in payload]
-                        msg_timestamp: int = int(time.time() * 1e3)
-                        msg_product_code: int = msg_data[0].productPairCode
-
-                        content = {"data": msg_data}
-                        msg_trading_pair: Optional[str] = None
-
-                        for trading_pair, instrument_id in self._trading_pair_id_map.items():
-                            if msg_product_code == instrument_id:
-                                msg_trading_pair = trading_pair
-                                break
-
-                        if msg_trading_pair:
-                            metadata = {
-                                "trading_pair": msg_trading_pair,
-                                "instrument_id": msg_product_code,
-                            }
-
-                            order_book_message = None
-                            if msg_event == CONSTANTS.WS_ORDER_BOOK_CHANNEL:
-                                order_book_message: NdaxOrderBookMessage = NdaxOrderBook.snapshot_message_from_exchange(
-                                    msg=content,
-                                    timestamp=msg_timestamp,
-                                    metadata=metadata)
-                            elif msg_event == CONSTANTS.WS_ORDER_BOOK_L2_UPDATE_EVENT:
-                                order_book_message: NdaxOrderBookMessage = NdaxOrderBook.diff_message_from_exchange(
-                                    msg=content,
-                                    timestamp=msg_timestamp,
-                                    metadata=metadata)
-                            self._last_traded_prices[
-                                order_book_message.trading_pair] = order_book_message.last_traded_price
-                            await output.put(order_book_message)
+                    if update_event_token not in raw_msg and snapshot_event_token not in raw_msg:
+                        continue
+                    msg: Dict[str, Any] = orjson.loads(raw_msg)
+                    msg_event: str = NdaxWebSocketAdaptor.endpoint_from_message(msg)
+                    if msg_event not in order_book_events:
+                        continue
+
+                    payload = NdaxWebSocketAdaptor.payload_from_message(msg)
+                    msg_data: List[NdaxOrderBookEntry] = list(map(NdaxOrderBookEntry._make, payload))
+                    msg_timestamp: int = int(time.time() * 1e3)
+                    msg_product_code: int = msg_data[0].productPairCode
+
+                    content = {"data": msg_data}
+                    msg_trading_pair: Optional[str] = self.trading_pair_from_instrument_id(msg_product_code)
+
+                    if msg_trading_pair:
+                        metadata = {
+                            "trading_pair": msg_trading_pair,
+                            "instrument_id": msg_product_code,
+                        }
+
+                        if msg_event == snapshot_event:
+                            order_book_message: NdaxOrderBookMessage = NdaxOrderBook.snapshot_message_from_exchange(
+                                msg=content,
+                                timestamp=msg_timestamp,
+                                metadata=metadata)
+                        else:
+                            order_book_message: NdaxOrderBookMessage = NdaxOrderBook.diff_message_from_exchange(
+                                msg=content,
+                                timestamp=msg_timestamp,
+                                metadata=metadata)
+                        self._last_traded_prices[
+                            order_book_message.trading_pair] = order_book_message.last_traded_price
+                        await output.put(order_book_message)
 
             except asyncio.CancelledError:
                 raise
@@ -319,7 +447,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     app_warning_msg="Unexpected error with WebSocket connection. Retrying in 30 seconds. "
                                     "Check network connection."
                 )
-                if ws_adaptor:
+                if ws_adaptor is not None:
                     await ws_adaptor.close()
                 await self._sleep(30.0)
 
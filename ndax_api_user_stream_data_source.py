@@ -1,8 +1,8 @@
 import aiohttp
 import asyncio
 import logging
+import orjson
 import time
-import ujson
 
 from typing import (
     Any,
@@ -125,7 +125,7 @@ class NdaxAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
                 async for msg in ws.iter_messages():
                     self._last_recv_time = int(time.time())
-                    output.put_nowait(ujson.loads(msg))
+                    output.put_nowait(orjson.loads(msg))
             except asyncio.CancelledError:
                 raise
             except Exception as ex:
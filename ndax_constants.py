@@ -39,6 +39,9 @@ WS_PING_ID = "WSPing"
 # WebSocket Message Events
 WS_ORDER_BOOK_L2_UPDATE_EVENT = "Level2UpdateEvent"
 
+# Number of price levels requested for REST snapshots and WebSocket Level2 subscriptions
+ORDER_BOOK_DEPTH = 200
+
 API_LIMIT_REACHED_ERROR_MESSAGE = "TOO MANY REQUESTS"
 
 MINUTE = 60
@@ -47,6 +50,10 @@ HTTP_LIMIT = 600
 WS_AUTH_LIMIT_ID = "AllWsAuth"
 WS_ENDPOINTS_LIMIT_ID = "AllWs"
 WS_LIMIT = 500
+# Linked limit pairs are never mutated by the throttler, so a single instance is shared by all the endpoint limits
+HTTP_LINKED_LIMIT = LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)
+WS_LINKED_LIMIT = LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)
+WS_AUTH_LINKED_LIMIT = LinkedLimitWeightPair(WS_AUTH_LIMIT_ID)
 RATE_LIMITS = [
     RateLimit(limit_id=HTTP_ENDPOINTS_LIMIT_ID, limit=HTTP_LIMIT, time_interval=MINUTE),
     # public http
@@ -54,68 +61,68 @@ RATE_LIMITS = [
         limit_id=MARKETS_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=ORDER_BOOK_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=LAST_TRADE_PRICE_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     # private http
     RateLimit(
         limit_id=ACCOUNT_POSITION_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=USER_ACCOUNT_INFOS_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=SEND_ORDER_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=CANCEL_ORDER_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=GET_ORDER_STATUS_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=GET_TRADES_HISTORY_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=GET_OPEN_ORDERS_PATH_URL,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=HTTP_PING_ID,
         limit=HTTP_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(HTTP_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[HTTP_LINKED_LIMIT],
     ),
     # ws public
     RateLimit(limit_id=WS_AUTH_LIMIT_ID, limit=50, time_interval=MINUTE),
@@ -124,42 +131,42 @@ RATE_LIMITS = [
         limit_id=ACCOUNT_POSITION_EVENT_ENDPOINT_NAME,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=AUTHENTICATE_USER_ENDPOINT_NAME,
         limit=50,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_AUTH_LIMIT_ID)],
+        linked_limits=[WS_AUTH_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=ORDER_STATE_EVENT_ENDPOINT_NAME,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=ORDER_TRADE_EVENT_ENDPOINT_NAME,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=SUBSCRIBE_ACCOUNT_EVENTS_ENDPOINT_NAME,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=WS_ORDER_BOOK_CHANNEL,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
     RateLimit(
         limit_id=WS_PING_ID,
         limit=WS_LIMIT,
         time_interval=MINUTE,
-        linked_limits=[LinkedLimitWeightPair(WS_ENDPOINTS_LIMIT_ID)],
+        linked_limits=[WS_LINKED_LIMIT],
     ),
 ]
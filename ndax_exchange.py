@@ -2,13 +2,12 @@ import aiohttp
 import asyncio
 import logging
 import math
-import time
-import ujson
+import orjson
 
 from decimal import Decimal
+from functools import lru_cache
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
     Optional,
@@ -16,6 +15,7 @@ from typing import (
 )
 
 from hummingbot.connector.exchange.ndax import ndax_constants as CONSTANTS, ndax_utils
+from hummingbot.connector.exchange.ndax.ndax_api_order_book_data_source import NdaxAPIOrderBookDataSource
 from hummingbot.connector.exchange.ndax.ndax_auth import NdaxAuth
 from hummingbot.connector.exchange.ndax.ndax_in_flight_order import (
     NdaxInFlightOrder, NdaxInFlightOrderNotCreated
@@ -53,6 +53,30 @@ s_decimal_0 = Decimal(0)
 
 RESOURCE_NOT_FOUND_ERR = "Resource Not Found"
 
+# NDAX order side codes and the events triggered for each trade type
+ORDER_SIDES = {TradeType.BUY: 0, TradeType.SELL: 1}
+ORDER_CREATED_EVENTS = {
+    TradeType.BUY: (MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent),
+    TradeType.SELL: (MarketEvent.SellOrderCreated, SellOrderCreatedEvent),
+}
+ORDER_COMPLETED_EVENTS = {
+    TradeType.BUY: (MarketEvent.BuyOrderCompleted, BuyOrderCompletedEvent),
+    TradeType.SELL: (MarketEvent.SellOrderCompleted, SellOrderCompletedEvent),
+}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: Union[float, int, str]) -> Decimal:
+    # Tick sizes, minimum quantities and balances repeat from one poll to the next, so the parsed Decimals are reused
+    return Decimal(str(value))
+
+
+def _json_default(obj: Any) -> Any:
+    # Order quantities and prices are Decimals, which orjson does not serialize natively. They are sent as JSON numbers
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class NdaxExchange(ExchangeBase):
     """
@@ -97,8 +121,12 @@ class NdaxExchange(ExchangeBase):
                               api_key=ndax_api_key,
                               secret_key=ndax_secret_key,
                               account_name=ndax_account_name)
+        self._public_headers: Dict[str, Any] = self._auth.get_headers()
         self._throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
-        self._shared_client = aiohttp.ClientSession()
+        self._shared_client = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300, enable_cleanup_closed=True),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
         self._order_book_tracker = NdaxOrderBookTracker(
             throttler=self._throttler, shared_client=self._shared_client, trading_pairs=trading_pairs, domain=domain
         )
@@ -106,6 +134,7 @@ class NdaxExchange(ExchangeBase):
             throttler=self._throttler, shared_client=self._shared_client, auth_assistant=self._auth, domain=domain
         )
         self._domain = domain
+        self._rest_api_url = ndax_utils.rest_api_url(domain)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
@@ -255,9 +284,18 @@ class NdaxExchange(ExchangeBase):
         self._order_book_tracker.start()
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
-            self._status_polling_task = safe_ensure_future(self._status_polling_loop())
             self._user_stream_tracker_task = safe_ensure_future(self._user_stream_tracker.start())
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
+            # The account id is resolved while the first trading rules request and the user stream connection are in
+            # flight, so that the first status poll does not have to request it before fetching the balances
+            try:
+                await self.initialized_account_id()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error while fetching the account id. Retrying on the next status poll.",
+                                      exc_info=True)
+            self._status_polling_task = safe_ensure_future(self._status_polling_loop())
 
     async def stop_network(self):
         """
@@ -277,6 +315,17 @@ class NdaxExchange(ExchangeBase):
             self._user_stream_event_listener_task.cancel()
             self._user_stream_event_listener_task = None
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Stops all the network tasks and closes the HTTP session. Unlike stop_network, which is also called when the
+        connection is temporarily lost, this is only meant to be used when the connector is being disposed.
+        """
+        await self.stop_network()
+        await self._shared_client.close()
+
     async def check_network(self) -> NetworkStatus:
         """
         This function is required by NetworkIterator base class and is called periodically to check
@@ -314,13 +363,13 @@ class NdaxExchange(ExchangeBase):
         :param limit_id: The id used for the API throttler. If not supplied, the `path_url` is used instead.
         :returns A response in json format.
         """
-        url = ndax_utils.rest_api_url(self._domain) + path_url
+        url = self._rest_api_url + path_url
 
         try:
             if is_auth_required:
                 headers = self._auth.get_auth_headers()
             else:
-                headers = self._auth.get_headers()
+                headers = self._public_headers
 
             limit_id = limit_id or path_url
             if method == "GET":
@@ -328,15 +377,18 @@ class NdaxExchange(ExchangeBase):
                     response = await self._shared_client.get(url, headers=headers, params=params)
             elif method == "POST":
                 async with self._throttler.execute_task(limit_id):
-                    response = await self._shared_client.post(url, headers=headers, data=ujson.dumps(data))
+                    response = await self._shared_client.post(url,
+                                                              headers=headers,
+                                                              data=orjson.dumps(data, default=_json_default))
             else:
                 raise NotImplementedError(f"{method} HTTP Method not implemented. ")
 
-            data = await response.text()
-            if data == CONSTANTS.API_LIMIT_REACHED_ERROR_MESSAGE:
-                raise Exception(f"The exchange API request limit has been reached (original error '{data}')")
+            raw_response = await response.read()
+            if raw_response == CONSTANTS.API_LIMIT_REACHED_ERROR_MESSAGE.encode():
+                raise Exception(f"The exchange API request limit has been reached (original error "
+                                f"'{raw_response.decode()}')")
 
-            parsed_response = await response.json()
+            parsed_response = orjson.loads(raw_response)
 
         except ValueError as e:
             self.logger().error(f"{str(e)}")
@@ -394,9 +446,9 @@ class NdaxExchange(ExchangeBase):
         """
         trading_rule: TradingRule = self._trading_rules[trading_pair]
 
-        trading_pair_ids: Dict[str, int] = await self._order_book_tracker.data_source.get_instrument_ids()
-
         try:
+            trading_pair_ids: Dict[str, int] = await self._order_book_tracker.data_source.get_instrument_ids()
+
             amount: Decimal = self.quantize_order_amount(trading_pair, amount)
             if amount < trading_rule.min_order_size:
                 raise ValueError(f"{trade_type.name} order amount {amount} is lower than the minimum order size "
@@ -407,7 +459,7 @@ class NdaxExchange(ExchangeBase):
                 "OMSId": 1,
                 "AccountId": await self.initialized_account_id(),
                 "ClientOrderId": int(order_id),
-                "Side": 0 if trade_type == TradeType.BUY else 1,
+                "Side": ORDER_SIDES[trade_type],
                 "Quantity": amount,
                 "TimeInForce": 1,  # GTC
             }
@@ -465,8 +517,7 @@ class NdaxExchange(ExchangeBase):
             )
 
     def trigger_order_created_event(self, order: NdaxInFlightOrder):
-        event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
-        event_class = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
+        event_tag, event_class = ORDER_CREATED_EVENTS[order.trade_type]
         self.trigger_event(event_tag,
                            event_class(
                                self.current_timestamp,
@@ -489,15 +540,7 @@ class NdaxExchange(ExchangeBase):
         :param price: The price in which the order is to be placed at
         :returns A new client order id
         """
-        order_id: str = ndax_utils.get_new_client_order_id(True, trading_pair)
-        safe_ensure_future(self._create_order(trade_type=TradeType.BUY,
-                                              trading_pair=trading_pair,
-                                              order_id=order_id,
-                                              amount=amount,
-                                              price=price,
-                                              order_type=order_type,
-                                              ))
-        return order_id
+        return self._place_order(TradeType.BUY, trading_pair, amount, order_type, price)
 
     def sell(self, trading_pair: str, amount: Decimal, order_type: OrderType = OrderType.MARKET,
              price: Decimal = s_decimal_NaN, **kwargs) -> str:
@@ -510,8 +553,16 @@ class NdaxExchange(ExchangeBase):
         :param price: The price in which the order is to be placed at
         :returns A new client order id
         """
-        order_id: str = ndax_utils.get_new_client_order_id(False, trading_pair)
-        safe_ensure_future(self._create_order(trade_type=TradeType.SELL,
+        return self._place_order(TradeType.SELL, trading_pair, amount, order_type, price)
+
+    def _place_order(self, trade_type: TradeType, trading_pair: str, amount: Decimal, order_type: OrderType,
+                     price: Decimal) -> str:
+        """
+        Generates a new client order id and schedules the order creation in the background.
+        :returns A new client order id
+        """
+        order_id: str = ndax_utils.get_new_client_order_id(trade_type is TradeType.BUY, trading_pair)
+        safe_ensure_future(self._create_order(trade_type=trade_type,
                                               trading_pair=trading_pair,
                                               order_id=order_id,
                                               amount=amount,
@@ -593,22 +644,26 @@ class NdaxExchange(ExchangeBase):
                                                                     params=query_params,
                                                                     is_auth_required=True)
 
-        trading_pair_id_map: Dict[str, int] = await self._order_book_tracker.data_source.get_instrument_ids()
-        id_trading_pair_map: Dict[int, str] = {instrument_id: trading_pair
-                                               for trading_pair, instrument_id in trading_pair_id_map.items()}
-
-        return [OpenOrder(client_order_id=order["ClientOrderId"],
-                          trading_pair=id_trading_pair_map[order["Instrument"]],
-                          price=Decimal(str(order["Price"])),
-                          amount=Decimal(str(order["Quantity"])),
-                          executed_amount=Decimal(str(order["QuantityExecuted"])),
-                          status=order["OrderState"],
-                          order_type=OrderType.LIMIT if order["OrderType"] == "Limit" else OrderType.MARKET,
-                          is_buy=True if order["Side"] == "Buy" else False,
-                          time=order["ReceiveTime"],
-                          exchange_order_id=order["OrderId"],
-                          )
-                for order in open_orders]
+        data_source: NdaxAPIOrderBookDataSource = self._order_book_tracker.data_source
+        await data_source.get_instrument_ids()
+
+        result: List[OpenOrder] = []
+        for order in open_orders:
+            trading_pair: Optional[str] = data_source.trading_pair_from_instrument_id(order["Instrument"])
+            if trading_pair is None:
+                raise KeyError(f"Open order {order['OrderId']} belongs to unknown instrument {order['Instrument']}.")
+            result.append(OpenOrder(client_order_id=order["ClientOrderId"],
+                                    trading_pair=trading_pair,
+                                    price=Decimal(str(order["Price"])),
+                                    amount=Decimal(str(order["Quantity"])),
+                                    executed_amount=Decimal(str(order["QuantityExecuted"])),
+                                    status=order["OrderState"],
+                                    order_type=OrderType.LIMIT if order["OrderType"] == "Limit" else OrderType.MARKET,
+                                    is_buy=True if order["Side"] == "Buy" else False,
+                                    time=order["ReceiveTime"],
+                                    exchange_order_id=order["OrderId"],
+                                    ))
+        return result
 
     async def cancel_all(self, timeout_sec: float) -> List[CancellationResult]:
         """
@@ -657,9 +712,9 @@ class NdaxExchange(ExchangeBase):
                 trading_pair = f"{instrument['Product1Symbol']}-{instrument['Product2Symbol']}"
 
                 result[trading_pair] = TradingRule(trading_pair=trading_pair,
-                                                   min_order_size=Decimal(str(instrument["MinimumQuantity"])),
-                                                   min_price_increment=Decimal(str(instrument["PriceIncrement"])),
-                                                   min_base_amount_increment=Decimal(str(instrument["QuantityIncrement"])),
+                                                   min_order_size=_to_decimal(instrument["MinimumQuantity"]),
+                                                   min_price_increment=_to_decimal(instrument["PriceIncrement"]),
+                                                   min_base_amount_increment=_to_decimal(instrument["QuantityIncrement"]),
                                                    )
             except Exception:
                 self.logger().error(f"Error parsing the trading pair rule: {instrument}. Skipping...",
@@ -675,7 +730,6 @@ class NdaxExchange(ExchangeBase):
             path_url=CONSTANTS.MARKETS_URL,
             params=params
         )
-        self._trading_rules.clear()
         self._trading_rules = self._format_trading_rules(instrument_info)
 
     async def _trading_rules_polling_loop(self):
@@ -699,9 +753,6 @@ class NdaxExchange(ExchangeBase):
         """
         Calls REST API to update total and available balances
         """
-        local_asset_names = set(self._account_balances.keys())
-        remote_asset_names = set()
-
         params = {
             "OMSId": 1,
             "AccountId": await self.initialized_account_id()
@@ -712,17 +763,18 @@ class NdaxExchange(ExchangeBase):
             params=params,
             is_auth_required=True
         )
+
+        # Assets no longer reported by the exchange are dropped by replacing the balance dictionaries as a whole
+        account_balances: Dict[str, Decimal] = {}
+        account_available_balances: Dict[str, Decimal] = {}
         for position in account_positions:
             asset_name = position["ProductSymbol"]
-            self._account_balances[asset_name] = Decimal(str(position["Amount"]))
-            self._account_available_balances[asset_name] = self._account_balances[asset_name] - Decimal(
-                str(position["Hold"]))
-            remote_asset_names.add(asset_name)
+            amount = _to_decimal(position["Amount"])
+            account_balances[asset_name] = amount
+            account_available_balances[asset_name] = amount - _to_decimal(position["Hold"])
 
-        asset_names_to_remove = local_asset_names.difference(remote_asset_names)
-        for asset_name in asset_names_to_remove:
-            del self._account_available_balances[asset_name]
-            del self._account_balances[asset_name]
+        self._account_balances = account_balances
+        self._account_available_balances = account_available_balances
 
     def start_tracking_order(self,
                              order_id: str,
@@ -845,9 +897,6 @@ class NdaxExchange(ExchangeBase):
         for order_status in parsed_status_responses:
             self._process_order_event_message(order_status)
 
-    def _reset_poll_notifier(self):
-        self._poll_notifier = asyncio.Event()
-
     async def _status_polling_loop(self):
         """
         Periodically update user balances and order status via REST API. This serves as a fallback measure for web
@@ -855,14 +904,12 @@ class NdaxExchange(ExchangeBase):
         """
         while True:
             try:
-                self._reset_poll_notifier()
                 await self._poll_notifier.wait()
-                start_ts = self.current_timestamp
+                self._poll_notifier.clear()
                 await safe_gather(
                     self._update_balances(),
                     self._update_order_status(),
                 )
-                self._last_poll_timestamp = start_ts
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -878,15 +925,12 @@ class NdaxExchange(ExchangeBase):
         Is called automatically by the clock for each clock tick(1 second by default).
         It checks if a status polling task is due for execution.
         """
-        now = time.time()
         poll_interval = (self.SHORT_POLL_INTERVAL
-                         if now - self._user_stream_tracker.last_recv_time > 60.0
+                         if timestamp - self._user_stream_tracker.last_recv_time > 60.0
                          else self.LONG_POLL_INTERVAL)
-        last_tick = int(self._last_timestamp / poll_interval)
-        current_tick = int(timestamp / poll_interval)
-        if current_tick > last_tick:
-            if not self._poll_notifier.is_set():
-                self._poll_notifier.set()
+        if timestamp - self._last_poll_timestamp >= poll_interval and not self._poll_notifier.is_set():
+            self._poll_notifier.set()
+            self._last_poll_timestamp = timestamp
         self._last_timestamp = timestamp
 
     def get_fee(self,
@@ -905,10 +949,21 @@ class NdaxExchange(ExchangeBase):
         is_maker = order_type is OrderType.LIMIT_MAKER
         return AddedToCostTradeFee(percent=self.estimate_fee_pct(is_maker))
 
-    async def _iter_user_event_queue(self) -> AsyncIterable[Dict[str, any]]:
+    async def _user_stream_event_listener(self):
+        """
+        Listens to message in _user_stream_tracker.user_stream queue.
+        """
+        endpoint_from_message = NdaxWebSocketAdaptor.endpoint_from_message
+        payload_from_message = NdaxWebSocketAdaptor.payload_from_message
+        event_processors = {
+            CONSTANTS.ACCOUNT_POSITION_EVENT_ENDPOINT_NAME: self._process_account_position_event,
+            CONSTANTS.ORDER_STATE_EVENT_ENDPOINT_NAME: self._process_order_event_message,
+            CONSTANTS.ORDER_TRADE_EVENT_ENDPOINT_NAME: self._process_trade_event_message,
+        }
+
         while True:
             try:
-                yield await self._user_stream_tracker.user_stream.get()
+                event_message: Dict[str, Any] = await self._user_stream_tracker.user_stream.get()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -918,22 +973,12 @@ class NdaxExchange(ExchangeBase):
                     app_warning_msg="Could not fetch user events from NDAX. Check API key and network connection."
                 )
                 await asyncio.sleep(1.0)
+                continue
 
-    async def _user_stream_event_listener(self):
-        """
-        Listens to message in _user_stream_tracker.user_stream queue.
-        """
-        async for event_message in self._iter_user_event_queue():
             try:
-                endpoint = NdaxWebSocketAdaptor.endpoint_from_message(event_message)
-                payload = NdaxWebSocketAdaptor.payload_from_message(event_message)
-
-                if endpoint == CONSTANTS.ACCOUNT_POSITION_EVENT_ENDPOINT_NAME:
-                    self._process_account_position_event(payload)
-                elif endpoint == CONSTANTS.ORDER_STATE_EVENT_ENDPOINT_NAME:
-                    self._process_order_event_message(payload)
-                elif endpoint == CONSTANTS.ORDER_TRADE_EVENT_ENDPOINT_NAME:
-                    self._process_trade_event_message(payload)
+                event_processor = event_processors.get(endpoint_from_message(event_message))
+                if event_processor is not None:
+                    event_processor(payload_from_message(event_message))
                 else:
                     self.logger().debug(f"Unknown event received from the connector ({event_message})")
             except asyncio.CancelledError:
@@ -944,8 +989,8 @@ class NdaxExchange(ExchangeBase):
 
     def _process_account_position_event(self, account_position_event: Dict[str, Any]):
         token = account_position_event["ProductSymbol"]
-        amount = Decimal(str(account_position_event["Amount"]))
-        on_hold = Decimal(str(account_position_event["Hold"]))
+        amount = _to_decimal(account_position_event["Amount"])
+        on_hold = _to_decimal(account_position_event["Hold"])
         self._account_balances[token] = amount
         self._account_available_balances[token] = (amount - on_hold)
 
@@ -1027,10 +1072,7 @@ class NdaxExchange(ExchangeBase):
                     self.logger().info(f"The {tracked_order.trade_type.name} order "
                                        f"{tracked_order.client_order_id} has completed "
                                        f"according to order status API")
-                    event_tag = (MarketEvent.BuyOrderCompleted if tracked_order.trade_type is TradeType.BUY
-                                 else MarketEvent.SellOrderCompleted)
-                    event_class = (BuyOrderCompletedEvent if tracked_order.trade_type is TradeType.BUY
-                                   else SellOrderCompletedEvent)
+                    event_tag, event_class = ORDER_COMPLETED_EVENTS[tracked_order.trade_type]
                     self.trigger_event(event_tag,
                                        event_class(self.current_timestamp,
                                                    tracked_order.client_order_id,
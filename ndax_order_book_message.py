@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 
 from collections import namedtuple
+from functools import cached_property
 from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
 )
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -66,17 +68,29 @@ class NdaxOrderBookMessage(OrderBookMessage):
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        entries: List[NdaxOrderBookEntry] = self.content["data"]
-        asks = [self._order_book_row_for_entry(entry) for entry in entries if entry.side == self._SELL_SIDE]
-        asks.sort(key=lambda row: (row.price, row.update_id))
-        return asks
+        return self._bid_and_ask_rows[1]
 
     @property
     def bids(self) -> List[OrderBookRow]:
+        return self._bid_and_ask_rows[0]
+
+    @cached_property
+    def _bid_and_ask_rows(self) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Splits the entries into bid and ask rows in a single pass. The result is cached because the tracker reads
+        both sides of every message, and diff messages are read again each time they are replayed over a snapshot.
+        """
+        bids: List[OrderBookRow] = []
+        asks: List[OrderBookRow] = []
         entries: List[NdaxOrderBookEntry] = self.content["data"]
-        bids = [self._order_book_row_for_entry(entry) for entry in entries if entry.side == self._BUY_SIDE]
+        for entry in entries:
+            if entry.side == self._BUY_SIDE:
+                bids.append(self._order_book_row_for_entry(entry))
+            elif entry.side == self._SELL_SIDE:
+                asks.append(self._order_book_row_for_entry(entry))
         bids.sort(key=lambda row: (row.price, row.update_id))
-        return bids
+        asks.sort(key=lambda row: (row.price, row.update_id))
+        return bids, asks
 
     def _order_book_row_for_entry(self, entry: NdaxOrderBookEntry) -> OrderBookRow:
         price = float(entry.price)
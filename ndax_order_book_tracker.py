@@ -13,6 +13,7 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookMessage
 from hummingbot.connector.exchange.ndax.ndax_api_order_book_data_source import NdaxAPIOrderBookDataSource
 from hummingbot.connector.exchange.ndax.ndax_order_book import NdaxOrderBook
@@ -59,6 +60,14 @@ class NdaxOrderBookTracker(OrderBookTracker):
         """
         return CONSTANTS.EXCHANGE_NAME
 
+    def stop(self):
+        """
+        Stops the tracking tasks and closes the session shared by the data sources created without an explicit client.
+        Those resolve the session on every request, so a new one is created if tracking is started again
+        """
+        super().stop()
+        safe_ensure_future(NdaxAPIOrderBookDataSource.close_session_instance())
+
     async def _track_single_book(self, trading_pair: str):
         """
         Update an order book with changes from the latest batch of received messages
@@ -3,12 +3,16 @@ import asyncio
 from enum import Enum
 from typing import AsyncIterable, Dict, Any, Optional
 
-import ujson
+import orjson
 
 import hummingbot.connector.exchange.ndax.ndax_constants as CONSTANTS
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 
 
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
 class NdaxMessageType(Enum):
     REQUEST_TYPE = 0
     REPLY_TYPE = 1
@@ -49,7 +53,7 @@ class NdaxWebSocketAdaptor:
 
     @classmethod
     def endpoint_from_raw_message(cls, raw_message: str) -> str:
-        message = ujson.loads(raw_message)
+        message = orjson.loads(raw_message)
         return cls.endpoint_from_message(message=message)
 
     @classmethod
@@ -58,12 +62,12 @@ class NdaxWebSocketAdaptor:
 
     @classmethod
     def payload_from_raw_message(cls, raw_message: str) -> Dict[str, Any]:
-        message = ujson.loads(raw_message)
+        message = orjson.loads(raw_message)
         return cls.payload_from_message(message=message)
 
     @classmethod
     def payload_from_message(cls, message: Dict[str, Any]) -> Dict[str, Any]:
-        payload = ujson.loads(message.get(cls._payload_field_name))
+        payload = orjson.loads(message.get(cls._payload_field_name))
         return payload
 
     async def next_message_number(self):
@@ -77,11 +81,11 @@ class NdaxWebSocketAdaptor:
         message = {self._message_type_field_name: NdaxMessageType.REQUEST_TYPE.value,
                    self._message_number_field_name: message_number,
                    self._endpoint_field_name: endpoint_name,
-                   self._payload_field_name: ujson.dumps(payload)}
+                   self._payload_field_name: _json_dumps(payload)}
 
         limit_id = limit_id or endpoint_name
         async with self._throttler.execute_task(limit_id):
-            await self._websocket.send_json(message)
+            await self._websocket.send_json(message, dumps=_json_dumps)
 
     async def receive(self):
         return await self._websocket.receive()